@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Shared class table and customization logic for the edge test template scripts
+
+Usage: python common.py {all,scripts,pages} [...]
+  all      customize script.js for every class (customize_all.py)
+  scripts  customize script.js with endpoint/id_field handling (customize_scripts.py)
+  pages    customize script.js and style.css for every page (fix_all_pages.py)
+"""
+import argparse
+import functools
+import multiprocessing
+import os
+import re
+
+# page/developer, which holds edge-tests-demo and the edge-tests-<class> pages
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEMO_SCRIPT_PATH = os.path.join(BASE_DIR, 'edge-tests-demo', 'script.js')
+DEMO_STYLE_PATH = os.path.join(BASE_DIR, 'edge-tests-demo', 'style.css')
+
+CLASSES = {
+    'cart': {'name': 'Cart', 'item': 'Cart Item', 'items': 'cart items', 'id_field': 'cartId'},
+    'wishlist': {'name': 'Wishlist', 'item': 'Wishlist Item', 'items': 'wishlist items', 'id_field': 'wishlistId'},
+    'coupon': {'name': 'Coupon', 'item': 'Coupon', 'items': 'coupons', 'id_field': 'couponId'},
+    'subscriptions': {'name': 'Subscriptions', 'item': 'Subscription', 'items': 'subscriptions', 'id_field': 'subscriptionId'},
+    'transactions': {'name': 'Transactions', 'item': 'Transaction', 'items': 'transactions', 'id_field': 'transactionId'},
+    'gateway-1': {'name': 'Gateway 1', 'item': 'Gateway 1 Item', 'items': 'gateway 1 items', 'id_field': 'gatewayId'},
+    'gateway-2': {'name': 'Gateway 2', 'item': 'Gateway 2 Item', 'items': 'gateway 2 items', 'id_field': 'gatewayId'},
+    'media': {'name': 'Media', 'item': 'Media Item', 'items': 'media items', 'id_field': 'mediaId'},
+    'products': {'name': 'Products', 'item': 'Product', 'items': 'products', 'id_field': 'productId'},
+    'orders': {'name': 'Orders', 'item': 'Order', 'items': 'orders', 'id_field': 'orderId'}
+}
+
+# Derived fields, computed once rather than inside every replacement pass
+for config in CLASSES.values():
+    config['name_lower'] = config['name'].lower()
+    config['name_nospace'] = config['name'].replace(' ', '')
+    config['item_lower'] = config['item'].lower()
+    config['items_title'] = config['items'].title()
+
+# The cart page is not regenerated by the pages command
+PAGE_CLASSES = [k for k in CLASSES if k != 'cart']
+
+SCRIPT_TARGETS = {k: os.path.join(BASE_DIR, f'edge-tests-{k}', 'script.js') for k in CLASSES}
+STYLE_TARGETS = {k: os.path.join(BASE_DIR, f'edge-tests-{k}', 'style.css') for k in CLASSES}
+
+@functools.lru_cache(maxsize=None)
+def read_demo_script():
+    with open(DEMO_SCRIPT_PATH, 'r', encoding='utf-8') as f:
+        return f.read()
+
+@functools.lru_cache(maxsize=None)
+def read_demo_style():
+    with open(DEMO_STYLE_PATH, 'r', encoding='utf-8') as f:
+        return f.read()
+
+@functools.lru_cache(maxsize=None)
+def _compile_keys(keys):
+    # Longest first so e.g. 'Demo Items' wins over 'Demo Item' at the same position
+    return re.compile('|'.join(re.escape(k) for k in sorted(keys, key=len, reverse=True)))
+
+def apply_replacements(content, replacements):
+    """Apply all replacements in a single left-to-right pass over content"""
+    pattern = _compile_keys(tuple(replacements))
+    return pattern.sub(lambda m: replacements[m.group(0)], content)
+
+def write_file(path, content):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+def customize_file(class_key, config, content):
+    """Customize script.js for a class (all command)"""
+    replacements = {
+        'Demo Class': f"{config['name']} Class",
+        '"demo"': f'"{class_key}"',
+        '/demo': f'/{class_key}',
+        'EdgeTestsDemo': f"EdgeTests{config['name_nospace']}",
+        '[Edge Tests Demo]': f"[Edge Tests {config['name']}]",
+        'Demo Item': config['item'],
+        'demo item': config['item_lower'],
+        'demo items': config['items'],
+        'Demo Items': config['items_title'],
+    }
+    write_file(SCRIPT_TARGETS[class_key], apply_replacements(content, replacements))
+    print(f"✓ Customized {SCRIPT_TARGETS[class_key]}")
+
+def customize_script(class_key, config, content):
+    """Customize script.js for a class, including id_field handling (scripts command)"""
+    replacements = {
+        'Demo Class': f"{config['name']} Class",
+        'demo functionality': f"{config['name_lower']} functionality",
+        'demo': class_key,
+        'Demo': config['name'],
+        '/demo': f'/{class_key}',
+        'EdgeTestsDemo': f"EdgeTests{config['name_nospace']}",
+        '[Edge Tests Demo]': f"[Edge Tests {config['name']}]",
+    }
+    content = apply_replacements(content, replacements)
+
+    # Handle userId -> id_field replacement in testScenario function
+    if config['id_field'] != 'userId':
+        content = content.replace('inputValues.userId', f"inputValues.{config['id_field']}")
+        content = content.replace('{userId}', '{' + config['id_field'] + '}')
+
+    write_file(SCRIPT_TARGETS[class_key], content)
+    print(f"Customized {SCRIPT_TARGETS[class_key]}")
+
+def fix_script(class_key, config, content):
+    replacements = {
+        'Demo Class': f"{config['name']} Class",
+        'demo/template': f"{config['name_lower']} functionality",
+        '"demo"': f'"{class_key}"',
+        "'demo'": f"'{class_key}'",
+        '/demo': f'/{class_key}',
+        'EdgeTestsDemo': f"EdgeTests{config['name_nospace']}",
+        '[Edge Tests Demo]': f"[Edge Tests {config['name']}]",
+        'Demo Item': config['item'],
+        'demo item': config['item_lower'],
+        'demo items': config['items'],
+        'Demo Items': config['items_title'],
+        '{userId}': '{' + config['id_field'] + '}',
+    }
+    content = apply_replacements(content, replacements)
+
+    # Special handling for userId in testScenario function
+    if config['id_field'] != 'userId':
+        content = content.replace('inputValues.userId', f"inputValues.{config['id_field']}")
+        content = content.replace("'userId'", f"'{config['id_field']}'")
+
+    return content
+
+def fix_style(config, content):
+    # Update the header comment
+    return content.replace('Demo Class (Template)', f"{config['name']} Class")
+
+def process_class(class_key, config, demo_script, demo_style):
+    """Customize and write both script.js and style.css for a class (pages command)"""
+    target_script = SCRIPT_TARGETS[class_key]
+    target_style = STYLE_TARGETS[class_key]
+
+    write_file(target_script, fix_script(class_key, config, demo_script))
+    write_file(target_style, fix_style(config, demo_style))
+    print(f"✓ Customized {target_script}\n✓ Copied style.css to {target_style}")
+
+def run_parallel(worker, class_keys):
+    """Run worker(class_key, config) for each class; classes are independent"""
+    items = [(k, CLASSES[k]) for k in class_keys]
+    with multiprocessing.Pool(processes=min(len(items), os.cpu_count() or 1)) as pool:
+        pool.starmap(worker, items)
+
+def run_all():
+    run_parallel(functools.partial(customize_file, content=read_demo_script()), CLASSES)
+    print("\n✅ All files customized!")
+
+def run_scripts():
+    run_parallel(functools.partial(customize_script, content=read_demo_script()), CLASSES)
+
+def run_pages():
+    print("Customizing all edge test pages...\n")
+    worker = functools.partial(process_class, demo_script=read_demo_script(), demo_style=read_demo_style())
+    run_parallel(worker, PAGE_CLASSES)
+    print("\n✅ All pages customized!")
+
+COMMANDS = {
+    'all': run_all,
+    'scripts': run_scripts,
+    'pages': run_pages,
+}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Customize edge test pages from the demo template')
+    parser.add_argument('commands', nargs='+', choices=COMMANDS, help='operations to run, in order')
+    args = parser.parse_args(argv)
+    for command in args.commands:
+        COMMANDS[command]()
+
+if __name__ == '__main__':
+    main()